@@ -19,16 +19,31 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-import sys
-from collections.abc import Sequence
-from typing import TYPE_CHECKING
+import queue
+import threading
+import zlib
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Literal
 
+from botocore.config import Config
+
+from airflow.exceptions import AirflowOptionalProviderFeatureException
 from airflow.models.xcom import XCOM_RETURN_KEY
 from airflow.providers.amazon.aws.hooks.s3 import S3Hook
 from airflow.providers.amazon.version_compat import BaseOperator
+from airflow.providers.common.compat.lineage.hook import get_hook_lineage_collector
 from airflow.providers.google.common.hooks.discovery_api import GoogleDiscoveryApiHook
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     try:
         from airflow.sdk.types import RuntimeTaskInstanceProtocol
@@ -40,6 +55,138 @@ if TYPE_CHECKING:
 # https://github.com/apache/airflow/pull/1618#discussion_r68249677
 MAX_XCOM_SIZE = 49344
 
+# Size of a single part of the multipart upload, S3 requires at least 5 MiB for all parts except the last one.
+# https://docs.aws.amazon.com/AmazonS3/latest/userguide/qfacts.html
+S3_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Supported compression types, mapped to the extension of the S3 key.
+S3_COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize object to compact UTF-8 encoded JSON, using ``orjson`` if it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class _S3StreamingUpload:
+    """
+    Write-only stream which pushes its content into a S3 object using multipart upload.
+
+    Written data is buffered until ``part_size`` bytes are collected, then uploaded as a single part
+    in a background thread, so at most ``max_concurrency`` parts are held in memory at the same time.
+    Data larger than ``part_size`` is split into several parts.
+    If the whole content fits into a single part it is uploaded by a regular ``PutObject`` request.
+
+    :param s3_hook: The S3 Hook used to create the upload.
+    :param bucket_name: Name of the bucket in which to store the object.
+    :param key: The S3 key of the object.
+    :param part_size: The size of each uploaded part in bytes.
+    :param max_concurrency: Maximum number of parts uploaded in parallel.
+    """
+
+    def __init__(
+        self,
+        s3_hook: S3Hook,
+        bucket_name: str,
+        key: str,
+        part_size: int = S3_MULTIPART_CHUNK_SIZE,
+        max_concurrency: int = 4,
+    ):
+        self.s3_hook = s3_hook
+        self.bucket_name = bucket_name
+        self.key = key
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self._buffer = bytearray()
+        self._upload_id: str | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._parts: list[Future[dict[str, Any]]] = []
+
+    def write(self, data: bytes) -> int:
+        view = memoryview(data)
+        while view:
+            # Never collect more than ``part_size`` bytes, so large data is not copied as a whole.
+            free_space = self.part_size - len(self._buffer)
+            self._buffer += view[:free_space]
+            view = view[free_space:]
+            if len(self._buffer) >= self.part_size:
+                self._flush_part()
+        return len(data)
+
+    def complete(self) -> None:
+        """Upload remaining buffered data and finalize the S3 object."""
+        if self._upload_id is None:
+            # Existence of the key is checked by the caller, there is no need to check it twice.
+            self.s3_hook.load_bytes(
+                bytes(self._buffer), key=self.key, bucket_name=self.bucket_name, replace=True
+            )
+            self._buffer.clear()
+            return
+
+        if self._buffer:
+            self._flush_part()
+        parts = [part.result() for part in self._parts]
+        self._shutdown_executor()
+        self.s3_hook.get_conn().complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+        get_hook_lineage_collector().add_output_asset(
+            context=self.s3_hook, scheme="s3", asset_kwargs={"bucket": self.bucket_name, "key": self.key}
+        )
+
+    def abort(self) -> None:
+        """Discard buffered data and abort the multipart upload, if it was started."""
+        self._buffer.clear()
+        if self._upload_id is None:
+            return
+        self._shutdown_executor(cancel_futures=True)
+        self.s3_hook.get_conn().abort_multipart_upload(
+            Bucket=self.bucket_name, Key=self.key, UploadId=self._upload_id
+        )
+
+    def _flush_part(self) -> None:
+        if self._upload_id is None:
+            self._upload_id = self.s3_hook.get_conn().create_multipart_upload(
+                Bucket=self.bucket_name, Key=self.key, **self.s3_hook.extra_args
+            )["UploadId"]
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+
+        # Backpressure: do not keep more than ``max_concurrency`` pending parts in memory.
+        pending = [part for part in self._parts if not part.done()]
+        if len(pending) >= self.max_concurrency:
+            wait(pending, return_when=FIRST_COMPLETED)
+        # Fail fast, there is no point to upload the following parts once any part failed.
+        for part in self._parts:
+            if part.done() and (error := part.exception()) is not None:
+                raise error
+
+        body = bytes(self._buffer)
+        self._buffer.clear()
+        part_number = len(self._parts) + 1
+        if TYPE_CHECKING:
+            assert self._executor
+        self._parts.append(self._executor.submit(self._upload_part, part_number, body))
+
+    def _upload_part(self, part_number: int, body: bytes) -> dict[str, Any]:
+        response = self.s3_hook.get_conn().upload_part(
+            Bucket=self.bucket_name,
+            Key=self.key,
+            PartNumber=part_number,
+            UploadId=self._upload_id,
+            Body=body,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _shutdown_executor(self, cancel_futures: bool = False) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=cancel_futures)
+            self._executor = None
+
 
 class GoogleApiToS3Operator(BaseOperator):
     """
@@ -73,6 +220,10 @@ class GoogleApiToS3Operator(BaseOperator):
             for valid url formats.
 
     :param google_api_response_via_xcom: Can be set to expose the google api response to xcom.
+        If the JSON encoded response doesn't fit into XCom, the pointer to the S3 object is pushed instead:
+        ``{"s3_uri": "s3://bucket/key", "size": <object size in bytes>, "sha256": <object checksum>}``.
+    :param xcom_pointer_only: If set, the pointer to the S3 object is always pushed to XCom instead of
+        the response. Used only if ``google_api_response_via_xcom`` is set.
     :param google_api_endpoint_params_via_xcom: If set to a value this value will be used as a key
         for pulling from xcom and updating the google api endpoint params.
     :param google_api_endpoint_params_via_xcom_task_ids: Task ids to filter xcom by.
@@ -81,9 +232,23 @@ class GoogleApiToS3Operator(BaseOperator):
 
         .. note:: This means the response will be a list of responses.
 
+    :param google_api_max_concurrent_pages: Maximum number of pages which are fetched ahead while
+        the already retrieved pages are uploaded to S3. Used only if ``google_api_pagination`` is enabled.
+    :param google_api_max_pages: If set, the task fails when the response has more pages,
+        before requesting the next page. Used only if ``google_api_pagination`` is enabled.
+    :param google_api_max_response_size: If set, the task fails as soon as the JSON encoded response
+        (before compression) exceeds this size in bytes. The upload of the incomplete response is aborted.
     :param google_api_num_retries: Define the number of retries for the Google API requests being made
         if it fails.
     :param s3_overwrite: Specifies whether the s3 file will be overwritten if exists.
+    :param s3_max_concurrent_uploads: Maximum number of parts of the multipart upload
+        which are uploaded to S3 in parallel.
+    :param s3_compression: Type of compression applied to the response before it is uploaded to S3,
+        either ``gzip`` or ``zstd``. The matching extension is appended to ``s3_destination_key``
+        if it is missing and the ``ContentEncoding`` of the S3 object is set.
+
+        .. note:: ``zstd`` compression requires the ``zstandard`` library to be installed.
+
     :param gcp_conn_id: The connection ID to use when fetching connection info.
     :param aws_conn_id: The connection id specifying the authentication information for the S3 Bucket.
     :param google_impersonation_chain: Optional Google service account to impersonate using
@@ -114,11 +279,17 @@ class GoogleApiToS3Operator(BaseOperator):
         google_api_endpoint_params: dict,
         s3_destination_key: str,
         google_api_response_via_xcom: str | None = None,
+        xcom_pointer_only: bool = False,
         google_api_endpoint_params_via_xcom: str | None = None,
         google_api_endpoint_params_via_xcom_task_ids: str | None = None,
         google_api_pagination: bool = False,
+        google_api_max_concurrent_pages: int = 4,
+        google_api_max_pages: int | None = None,
+        google_api_max_response_size: int | None = None,
         google_api_num_retries: int = 0,
         s3_overwrite: bool = False,
+        s3_max_concurrent_uploads: int = 4,
+        s3_compression: Literal["gzip", "zstd"] | None = None,
         gcp_conn_id: str = "google_cloud_default",
         aws_conn_id: str | None = "aws_default",
         google_impersonation_chain: str | Sequence[str] | None = None,
@@ -131,15 +302,56 @@ class GoogleApiToS3Operator(BaseOperator):
         self.google_api_endpoint_params = google_api_endpoint_params
         self.s3_destination_key = s3_destination_key
         self.google_api_response_via_xcom = google_api_response_via_xcom
+        self.xcom_pointer_only = xcom_pointer_only
         self.google_api_endpoint_params_via_xcom = google_api_endpoint_params_via_xcom
         self.google_api_endpoint_params_via_xcom_task_ids = google_api_endpoint_params_via_xcom_task_ids
         self.google_api_pagination = google_api_pagination
+        self.google_api_max_concurrent_pages = google_api_max_concurrent_pages
+        self.google_api_max_pages = google_api_max_pages
+        self.google_api_max_response_size = google_api_max_response_size
         self.google_api_num_retries = google_api_num_retries
         self.s3_overwrite = s3_overwrite
+        self.s3_max_concurrent_uploads = s3_max_concurrent_uploads
+        if s3_compression is not None and s3_compression not in S3_COMPRESSION_EXTENSIONS:
+            raise ValueError(
+                f"Invalid `s3_compression` value {s3_compression!r}, "
+                f"expected one of {list(S3_COMPRESSION_EXTENSIONS)}."
+            )
+        self.s3_compression = s3_compression
         self.gcp_conn_id = gcp_conn_id
         self.aws_conn_id = aws_conn_id
         self.google_impersonation_chain = google_impersonation_chain
 
+    @cached_property
+    def _s3_bucket_key(self) -> tuple[str, str]:
+        """Bucket name and key of the rendered ``s3_destination_key``, including compression extension."""
+        bucket_name, key = S3Hook.parse_s3_url(self.s3_destination_key)
+        if self.s3_compression:
+            extension = S3_COMPRESSION_EXTENSIONS[self.s3_compression]
+            if not key.endswith(extension):
+                key += extension
+        return bucket_name, key
+
+    @cached_property
+    def _s3_hook(self) -> S3Hook:
+        """
+        S3 Hook shared by all requests of the transfer.
+
+        The connection pool of its client is sized for ``s3_max_concurrent_uploads`` parallel part uploads,
+        and the adaptive retry mode is used to throttle them, unless these options are set
+        in ``config_kwargs`` of the AWS connection.
+        """
+        hook_kwargs: dict[str, Any] = {
+            "aws_conn_id": self.aws_conn_id,
+            "extra_args": {"ContentEncoding": self.s3_compression} if self.s3_compression else None,
+        }
+        config = Config(
+            max_pool_connections=max(8, self.s3_max_concurrent_uploads),
+            retries={"max_attempts": 10, "mode": "adaptive"},
+        )
+        # Explicit hook config replaces the connection one, so merge the connection config over the defaults.
+        return S3Hook(**hook_kwargs, config=config.merge(S3Hook(**hook_kwargs).config))
+
     def execute(self, context: Context) -> None:
         """
         Transfers Google APIs json data to S3.
@@ -151,35 +363,197 @@ class GoogleApiToS3Operator(BaseOperator):
         if self.google_api_endpoint_params_via_xcom:
             self._update_google_api_endpoint_params_via_xcom(context["task_instance"])
 
-        data = self._retrieve_data_from_google_api()
+        collect_xcom_pages = self.google_api_response_via_xcom and not self.xcom_pointer_only
+        xcom_pages: list[dict] | None = [] if collect_xcom_pages else None
 
-        self._load_data_to_s3(data)
+        # Close the pages explicitly if the upload fails, so the background fetching of pages stops at once.
+        with closing(self._iter_data_from_google_api()) as pages:
+            serialized_size, s3_object = self._load_data_to_s3(pages, xcom_pages=xcom_pages)
 
         if self.google_api_response_via_xcom:
-            self._expose_google_api_response_via_xcom(context["task_instance"], data)
+            self._expose_google_api_response_via_xcom(
+                context["task_instance"], xcom_pages, serialized_size=serialized_size, s3_object=s3_object
+            )
 
-    def _retrieve_data_from_google_api(self) -> dict:
+    def _iter_data_from_google_api(self) -> Generator[dict, None, None]:
+        """Yield the response of the endpoint, one item per page if pagination is enabled."""
         google_discovery_api_hook = GoogleDiscoveryApiHook(
             gcp_conn_id=self.gcp_conn_id,
             api_service_name=self.google_api_service_name,
             api_version=self.google_api_service_version,
             impersonation_chain=self.google_impersonation_chain,
         )
-        return google_discovery_api_hook.query(
-            endpoint=self.google_api_endpoint_path,
-            data=self.google_api_endpoint_params,
-            paginate=self.google_api_pagination,
-            num_retries=self.google_api_num_retries,
+        if self.google_api_pagination:
+            yield from self._prefetch_pages(self._paginate_google_api(google_discovery_api_hook))
+        else:
+            yield google_discovery_api_hook.query(
+                endpoint=self.google_api_endpoint_path,
+                data=self.google_api_endpoint_params,
+                paginate=False,
+                num_retries=self.google_api_num_retries,
+            )
+
+    def _paginate_google_api(self, google_discovery_api_hook: GoogleDiscoveryApiHook) -> Iterator[dict]:
+        """Request the endpoint page by page, the same way as ``GoogleDiscoveryApiHook.query`` does."""
+        google_api_resource = google_discovery_api_hook.get_conn()
+        *api_resources, api_method = self.google_api_endpoint_path.split(".")[1:]
+        for api_resource in api_resources:
+            google_api_resource = getattr(google_api_resource, api_resource)()
+
+        request = getattr(google_api_resource, api_method)(**self.google_api_endpoint_params)
+        pages_count = 0
+        while request is not None:
+            if self.google_api_max_pages is not None and pages_count >= self.google_api_max_pages:
+                raise RuntimeError(
+                    f"The response has more than {self.google_api_max_pages} pages, "
+                    "increase `google_api_max_pages` to retrieve it."
+                )
+            response = request.execute(num_retries=self.google_api_num_retries)
+            pages_count += 1
+            yield response
+            request = getattr(google_api_resource, f"{api_method}_next")(request, response)
+
+    def _prefetch_pages(self, pages: Iterator[dict]) -> Iterator[dict]:
+        """
+        Retrieve pages in a background thread, while the consumer processes already retrieved ones.
+
+        The next page can be requested only after the previous one is received, so instead of requesting
+        the pages in parallel, up to ``google_api_max_concurrent_pages`` pages are fetched ahead.
+        """
+        prefetched: queue.Queue[tuple[dict | None, BaseException | None, bool]] = queue.Queue(
+            maxsize=max(self.google_api_max_concurrent_pages, 1)
         )
+        stopped = threading.Event()
+
+        def put(item: tuple[dict | None, BaseException | None, bool]) -> bool:
+            while not stopped.is_set():
+                try:
+                    prefetched.put(item, timeout=1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch() -> None:
+            try:
+                for page in pages:
+                    if not put((page, None, False)):
+                        return
+            except Exception as e:
+                put((None, e, True))
+            else:
+                put((None, None, True))
+
+        fetcher = threading.Thread(target=fetch, name=f"{self.task_id}-google-api-pages", daemon=True)
+        fetcher.start()
+        try:
+            while True:
+                page, error, finished = prefetched.get()
+                if error is not None:
+                    raise error
+                if finished:
+                    return
+                if TYPE_CHECKING:
+                    assert page is not None
+                yield page
+        finally:
+            stopped.set()
+            fetcher.join()
+
+    def _load_data_to_s3(
+        self, pages: Iterable[dict], xcom_pages: list[dict] | None = None
+    ) -> tuple[int, dict[str, Any]]:
+        """
+        Upload the JSON encoded response to S3.
+
+        The response is encoded into compact JSON, or into the JSON list of pages if the response
+        is paginated. Pages are encoded one by one and released as soon as they are uploaded.
 
-    def _load_data_to_s3(self, data: dict) -> None:
-        s3_hook = S3Hook(aws_conn_id=self.aws_conn_id)
-        s3_hook.load_string(
-            string_data=json.dumps(data),
-            bucket_name=S3Hook.parse_s3_url(self.s3_destination_key)[0],
-            key=S3Hook.parse_s3_url(self.s3_destination_key)[1],
-            replace=self.s3_overwrite,
+        :param pages: The response of the endpoint, one item per page.
+        :param xcom_pages: If set, the pages are collected into this list to be pushed to XCom.
+            Collected pages are released as soon as the encoded response doesn't fit into XCom.
+        :return: The size of the JSON encoded response in bytes, and the pointer to the S3 object
+            with its URI, size in bytes and SHA-256 checksum.
+        """
+        s3_hook = self._s3_hook
+        bucket_name, key = self._s3_bucket_key
+        if not self.s3_overwrite and s3_hook.check_for_key(key, bucket_name):
+            raise ValueError(f"The key {key} already exists.")
+
+        upload = _S3StreamingUpload(
+            s3_hook=s3_hook,
+            bucket_name=bucket_name,
+            key=key,
+            max_concurrency=self.s3_max_concurrent_uploads,
         )
+        compressor = self._get_compressor()
+        serialized_size = 0
+        object_size = 0
+        object_digest = hashlib.sha256()
+
+        def upload_object_data(data: bytes) -> None:
+            nonlocal object_size
+            object_size += len(data)
+            object_digest.update(data)
+            upload.write(data)
+
+        def write(data: bytes) -> None:
+            nonlocal serialized_size
+            serialized_size += len(data)
+            if compressor is not None:
+                data = compressor.compress(data)
+            upload_object_data(data)
+
+        try:
+            if self.google_api_pagination:
+                write(b"[")
+            for page_number, page in enumerate(pages):
+                if page_number:
+                    write(b",")
+                write(_json_dumps(page))
+                if (
+                    self.google_api_max_response_size is not None
+                    and serialized_size > self.google_api_max_response_size
+                ):
+                    raise RuntimeError(
+                        f"The size of the response exceeds {self.google_api_max_response_size} bytes, "
+                        "increase `google_api_max_response_size` to retrieve it."
+                    )
+                if xcom_pages is not None:
+                    if serialized_size < MAX_XCOM_SIZE:
+                        xcom_pages.append(page)
+                    else:
+                        # The pointer to the S3 object is pushed to XCom instead of the response.
+                        xcom_pages.clear()
+                del page
+            if self.google_api_pagination:
+                write(b"]")
+            if compressor is not None:
+                upload_object_data(compressor.flush())
+            upload.complete()
+        except BaseException:
+            upload.abort()
+            raise
+        s3_object = {
+            "s3_uri": f"s3://{bucket_name}/{key}",
+            "size": object_size,
+            "sha256": object_digest.hexdigest(),
+        }
+        return serialized_size, s3_object
+
+    def _get_compressor(self) -> Any:
+        if self.s3_compression == "gzip":
+            # Add 16 to window size to produce the gzip header and trailer.
+            return zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        if self.s3_compression == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                raise AirflowOptionalProviderFeatureException(
+                    "The `zstandard` library is required for `zstd` compression, please install it."
+                ) from None
+            return zstandard.ZstdCompressor(level=3).compressobj()
+        return None
 
     def _update_google_api_endpoint_params_via_xcom(self, task_instance: RuntimeTaskInstanceProtocol) -> None:
         if self.google_api_endpoint_params_via_xcom:
@@ -190,9 +564,16 @@ class GoogleApiToS3Operator(BaseOperator):
             self.google_api_endpoint_params.update(google_api_endpoint_params)
 
     def _expose_google_api_response_via_xcom(
-        self, task_instance: RuntimeTaskInstanceProtocol, data: dict
+        self,
+        task_instance: RuntimeTaskInstanceProtocol,
+        xcom_pages: list[dict] | None,
+        serialized_size: int,
+        s3_object: dict[str, Any],
     ) -> None:
-        if sys.getsizeof(data) < MAX_XCOM_SIZE:
-            task_instance.xcom_push(key=self.google_api_response_via_xcom or XCOM_RETURN_KEY, value=data)
+        key = self.google_api_response_via_xcom or XCOM_RETURN_KEY
+        if xcom_pages is None or serialized_size >= MAX_XCOM_SIZE:
+            self.log.info("Pushing the pointer to %s to XCom instead of the response.", s3_object["s3_uri"])
+            task_instance.xcom_push(key=key, value=s3_object)
         else:
-            raise RuntimeError("The size of the downloaded data is too large to push to XCom!")
+            data = xcom_pages if self.google_api_pagination else xcom_pages[0]
+            task_instance.xcom_push(key=key, value=data)
@@ -17,14 +17,27 @@
 # under the License.
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+import gzip
+import hashlib
+import json
+import threading
+from unittest.mock import ANY, Mock, call, patch
 
 import pytest
 
 from airflow import models
-from airflow.providers.amazon.aws.transfers.google_api_to_s3 import MAX_XCOM_SIZE, GoogleApiToS3Operator
+from airflow.providers.amazon.aws.transfers.google_api_to_s3 import (
+    MAX_XCOM_SIZE,
+    GoogleApiToS3Operator,
+    _json_dumps,
+    _S3StreamingUpload,
+)
 
-# This test mocks json.dumps so it won't work for database isolation mode
+GOOGLE_API_RESPONSE = {"reports": [{"columnHeader": {"dimensions": ["ga:date"]}, "data": {"rows": []}}]}
+
+
+def _to_json(data) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
 
 
 class TestGoogleApiToS3:
@@ -66,10 +79,10 @@ class TestGoogleApiToS3:
         }
 
     @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.query")
-    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_string")
-    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.json.dumps")
-    def test_execute(self, mock_json_dumps, mock_s3_hook_load_string, mock_google_api_hook_query):
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute(self, mock_s3_hook_load_bytes, mock_google_api_hook_query):
         context = {"task_instance": Mock()}
+        mock_google_api_hook_query.return_value = GOOGLE_API_RESPONSE
 
         GoogleApiToS3Operator(**self.kwargs).execute(context)
 
@@ -79,20 +92,227 @@ class TestGoogleApiToS3:
             paginate=self.kwargs["google_api_pagination"],
             num_retries=self.kwargs["google_api_num_retries"],
         )
-        mock_json_dumps.assert_called_once_with(mock_google_api_hook_query.return_value)
-        mock_s3_hook_load_string.assert_called_once_with(
-            string_data=mock_json_dumps.return_value,
-            bucket_name="test",
+        mock_s3_hook_load_bytes.assert_called_once_with(
+            _to_json(GOOGLE_API_RESPONSE),
             key="google_api_to_s3_test.csv",
-            replace=self.kwargs["s3_overwrite"],
+            bucket_name="test",
+            replace=True,
         )
         context["task_instance"].xcom_pull.assert_not_called()
         context["task_instance"].xcom_push.assert_not_called()
 
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.get_conn")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_with_pagination(self, mock_s3_hook_load_bytes, mock_google_api_hook_get_conn):
+        context = {"task_instance": Mock()}
+        pages = [GOOGLE_API_RESPONSE, {"reports": []}, {}]
+        requests = [Mock(**{"execute.return_value": page}) for page in pages]
+        mock_reports = mock_google_api_hook_get_conn.return_value.reports.return_value
+        mock_reports.batchGet.return_value = requests[0]
+        mock_reports.batchGet_next.side_effect = [*requests[1:], None]
+
+        GoogleApiToS3Operator(
+            **{**self.kwargs, "google_api_pagination": True, "google_api_max_concurrent_pages": 1}
+        ).execute(context)
+
+        mock_reports.batchGet.assert_called_once_with(**self.kwargs["google_api_endpoint_params"])
+        assert mock_reports.batchGet_next.call_args_list == [
+            call(request, page) for request, page in zip(requests, pages)
+        ]
+        for request in requests:
+            request.execute.assert_called_once_with(num_retries=self.kwargs["google_api_num_retries"])
+        mock_s3_hook_load_bytes.assert_called_once_with(
+            _to_json(pages),
+            key="google_api_to_s3_test.csv",
+            bucket_name="test",
+            replace=True,
+        )
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.get_conn")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_with_pagination_and_xcom(self, mock_s3_hook_load_bytes, mock_google_api_hook_get_conn):
+        context = {"task_instance": Mock()}
+        pages = [GOOGLE_API_RESPONSE, {"reports": []}]
+        mock_reports = mock_google_api_hook_get_conn.return_value.reports.return_value
+        mock_reports.batchGet.return_value.execute.return_value = pages[0]
+        mock_reports.batchGet_next.side_effect = [Mock(**{"execute.return_value": pages[1]}), None]
+
+        GoogleApiToS3Operator(
+            **{**self.kwargs, "google_api_pagination": True, "google_api_response_via_xcom": "response"}
+        ).execute(context)
+
+        mock_s3_hook_load_bytes.assert_called_once()
+        context["task_instance"].xcom_push.assert_called_once_with(key="response", value=pages)
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.get_conn")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_with_pagination_failed_request(
+        self, mock_s3_hook_load_bytes, mock_google_api_hook_get_conn
+    ):
+        context = {"task_instance": Mock()}
+        mock_reports = mock_google_api_hook_get_conn.return_value.reports.return_value
+        mock_reports.batchGet.return_value.execute.return_value = GOOGLE_API_RESPONSE
+        mock_reports.batchGet_next.return_value.execute.side_effect = RuntimeError("Quota exceeded")
+
+        with pytest.raises(RuntimeError, match="Quota exceeded"):
+            GoogleApiToS3Operator(**{**self.kwargs, "google_api_pagination": True}).execute(context)
+
+        mock_s3_hook_load_bytes.assert_not_called()
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.get_conn")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_with_pagination_exceeded_max_pages(
+        self, mock_s3_hook_load_bytes, mock_google_api_hook_get_conn
+    ):
+        context = {"task_instance": Mock()}
+        mock_reports = mock_google_api_hook_get_conn.return_value.reports.return_value
+        mock_reports.batchGet.return_value.execute.return_value = GOOGLE_API_RESPONSE
+        mock_reports.batchGet_next.return_value.execute.return_value = GOOGLE_API_RESPONSE
+
+        with pytest.raises(RuntimeError, match="more than 2 pages"):
+            GoogleApiToS3Operator(
+                **{**self.kwargs, "google_api_pagination": True, "google_api_max_pages": 2}
+            ).execute(context)
+
+        # The third page is never requested.
+        mock_reports.batchGet_next.return_value.execute.assert_called_once()
+        mock_s3_hook_load_bytes.assert_not_called()
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.get_conn")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_with_pagination_failed_upload_stops_fetching_pages(
+        self, mock_s3_hook_load_bytes, mock_google_api_hook_get_conn
+    ):
+        context = {"task_instance": Mock()}
+        mock_reports = mock_google_api_hook_get_conn.return_value.reports.return_value
+        # Endless pagination, pages are fetched until the consumer stops.
+        mock_reports.batchGet.return_value.execute.return_value = GOOGLE_API_RESPONSE
+        mock_reports.batchGet_next.return_value.execute.return_value = GOOGLE_API_RESPONSE
+
+        with pytest.raises(RuntimeError, match="exceeds 100 bytes"):
+            GoogleApiToS3Operator(
+                **{**self.kwargs, "google_api_pagination": True, "google_api_max_response_size": 100}
+            ).execute(context)
+
+        assert not any(thread.name == "task_id-google-api-pages" for thread in threading.enumerate())
+        mock_s3_hook_load_bytes.assert_not_called()
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.query")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_exceeded_max_response_size(self, mock_s3_hook_load_bytes, mock_google_api_hook_query):
+        context = {"task_instance": Mock()}
+        mock_google_api_hook_query.return_value = GOOGLE_API_RESPONSE
+
+        with pytest.raises(RuntimeError, match="exceeds 10 bytes"):
+            GoogleApiToS3Operator(**{**self.kwargs, "google_api_max_response_size": 10}).execute(context)
+
+        mock_s3_hook_load_bytes.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "s3_destination_key, expected_key",
+        [
+            ("s3://test/google_api_to_s3_test.json", "google_api_to_s3_test.json.gz"),
+            ("s3://test/google_api_to_s3_test.json.gz", "google_api_to_s3_test.json.gz"),
+        ],
+    )
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.query")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_with_gzip_compression(
+        self, mock_s3_hook_load_bytes, mock_google_api_hook_query, s3_destination_key, expected_key
+    ):
+        context = {"task_instance": Mock()}
+        mock_google_api_hook_query.return_value = GOOGLE_API_RESPONSE
+
+        op = GoogleApiToS3Operator(
+            **{**self.kwargs, "s3_destination_key": s3_destination_key, "s3_compression": "gzip"}
+        )
+        op.execute(context)
+
+        mock_s3_hook_load_bytes.assert_called_once_with(
+            ANY, key=expected_key, bucket_name="test", replace=True
+        )
+        assert gzip.decompress(mock_s3_hook_load_bytes.call_args.args[0]) == _to_json(GOOGLE_API_RESPONSE)
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.query")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_with_zstd_compression(self, mock_s3_hook_load_bytes, mock_google_api_hook_query):
+        zstandard = pytest.importorskip("zstandard")
+        context = {"task_instance": Mock()}
+        mock_google_api_hook_query.return_value = GOOGLE_API_RESPONSE
+
+        GoogleApiToS3Operator(**{**self.kwargs, "s3_compression": "zstd"}).execute(context)
+
+        mock_s3_hook_load_bytes.assert_called_once_with(
+            ANY, key="google_api_to_s3_test.csv.zst", bucket_name="test", replace=True
+        )
+        compressed = mock_s3_hook_load_bytes.call_args.args[0]
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(compressed) == _to_json(
+            GOOGLE_API_RESPONSE
+        )
+
+    def test_invalid_compression(self):
+        with pytest.raises(ValueError, match="Invalid `s3_compression` value 'bz2'"):
+            GoogleApiToS3Operator(**{**self.kwargs, "s3_compression": "bz2"})
+
+    @pytest.mark.parametrize(
+        "s3_max_concurrent_uploads, config_kwargs, expected_max_pool_connections, expected_retries",
+        [
+            pytest.param(4, None, 8, {"max_attempts": 10, "mode": "adaptive"}, id="default"),
+            pytest.param(16, None, 16, {"max_attempts": 10, "mode": "adaptive"}, id="concurrent-uploads"),
+            pytest.param(
+                4,
+                {"max_pool_connections": 2, "retries": {"mode": "standard"}},
+                2,
+                {"mode": "standard"},
+                id="connection-config",
+            ),
+        ],
+    )
+    def test_s3_hook_config(
+        self,
+        create_connection_without_db,
+        s3_max_concurrent_uploads,
+        config_kwargs,
+        expected_max_pool_connections,
+        expected_retries,
+    ):
+        create_connection_without_db(
+            models.Connection(
+                conn_id="s3_test_config",
+                conn_type="aws",
+                extra=json.dumps({"config_kwargs": config_kwargs} if config_kwargs else {}),
+            )
+        )
+        op = GoogleApiToS3Operator(
+            **{
+                **self.kwargs,
+                "aws_conn_id": "s3_test_config",
+                "s3_max_concurrent_uploads": s3_max_concurrent_uploads,
+            }
+        )
+
+        assert op._s3_hook is op._s3_hook
+        assert op._s3_hook.config.max_pool_connections == expected_max_pool_connections
+        assert op._s3_hook.config.retries == expected_retries
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.query")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.check_for_key", return_value=True)
+    def test_execute_key_already_exists(
+        self, mock_s3_hook_check_for_key, mock_s3_hook_load_bytes, mock_google_api_hook_query
+    ):
+        context = {"task_instance": Mock()}
+        mock_google_api_hook_query.return_value = GOOGLE_API_RESPONSE
+
+        with pytest.raises(ValueError, match="already exists"):
+            GoogleApiToS3Operator(**{**self.kwargs, "s3_overwrite": False}).execute(context)
+
+        mock_s3_hook_check_for_key.assert_called_once_with("google_api_to_s3_test.csv", "test")
+        mock_s3_hook_load_bytes.assert_not_called()
+
     @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.query")
-    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_string")
-    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.json.dumps")
-    def test_execute_with_xcom(self, mock_json_dumps, mock_s3_hook_load_string, mock_google_api_hook_query):
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_with_xcom(self, mock_s3_hook_load_bytes, mock_google_api_hook_query):
         context = {"task_instance": Mock()}
         xcom_kwargs = {
             "google_api_response_via_xcom": "response",
@@ -100,6 +320,7 @@ class TestGoogleApiToS3:
             "google_api_endpoint_params_via_xcom_task_ids": "params",
         }
         context["task_instance"].xcom_pull.return_value = {}
+        mock_google_api_hook_query.return_value = GOOGLE_API_RESPONSE
 
         GoogleApiToS3Operator(**self.kwargs, **xcom_kwargs).execute(context)
 
@@ -109,29 +330,24 @@ class TestGoogleApiToS3:
             paginate=self.kwargs["google_api_pagination"],
             num_retries=self.kwargs["google_api_num_retries"],
         )
-        mock_json_dumps.assert_called_once_with(mock_google_api_hook_query.return_value)
-        mock_s3_hook_load_string.assert_called_once_with(
-            string_data=mock_json_dumps.return_value,
-            bucket_name="test",
+        mock_s3_hook_load_bytes.assert_called_once_with(
+            _to_json(GOOGLE_API_RESPONSE),
             key="google_api_to_s3_test.csv",
-            replace=self.kwargs["s3_overwrite"],
+            bucket_name="test",
+            replace=True,
         )
         context["task_instance"].xcom_pull.assert_called_once_with(
             task_ids=xcom_kwargs["google_api_endpoint_params_via_xcom_task_ids"],
             key=xcom_kwargs["google_api_endpoint_params_via_xcom"],
         )
         context["task_instance"].xcom_push.assert_called_once_with(
-            key=xcom_kwargs["google_api_response_via_xcom"], value=mock_google_api_hook_query.return_value
+            key=xcom_kwargs["google_api_response_via_xcom"], value=GOOGLE_API_RESPONSE
         )
 
     @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.query")
-    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_string")
-    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.json.dumps")
-    @patch(
-        "airflow.providers.amazon.aws.transfers.google_api_to_s3.sys.getsizeof", return_value=MAX_XCOM_SIZE
-    )
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
     def test_execute_with_xcom_exceeded_max_xcom_size(
-        self, mock_sys_getsizeof, mock_json_dumps, mock_s3_hook_load_string, mock_google_api_hook_query
+        self, mock_s3_hook_load_bytes, mock_google_api_hook_query
     ):
         context = {"task_instance": Mock()}
         xcom_kwargs = {
@@ -140,9 +356,11 @@ class TestGoogleApiToS3:
             "google_api_endpoint_params_via_xcom_task_ids": "params",
         }
         context["task_instance"].xcom_pull.return_value = {}
+        # The shallow size of the response is small, but the encoded one exceeds the XCom limit.
+        response = {"rows": ["x" * 1024] * (MAX_XCOM_SIZE // 1024)}
+        mock_google_api_hook_query.return_value = response
 
-        with pytest.raises(RuntimeError):
-            GoogleApiToS3Operator(**self.kwargs, **xcom_kwargs).execute(context)
+        GoogleApiToS3Operator(**self.kwargs, **xcom_kwargs).execute(context)
 
         mock_google_api_hook_query.assert_called_once_with(
             endpoint=self.kwargs["google_api_endpoint_path"],
@@ -150,16 +368,156 @@ class TestGoogleApiToS3:
             paginate=self.kwargs["google_api_pagination"],
             num_retries=self.kwargs["google_api_num_retries"],
         )
-        mock_json_dumps.assert_called_once_with(mock_google_api_hook_query.return_value)
-        mock_s3_hook_load_string.assert_called_once_with(
-            string_data=mock_json_dumps.return_value,
-            bucket_name="test",
+        mock_s3_hook_load_bytes.assert_called_once_with(
+            _to_json(response),
             key="google_api_to_s3_test.csv",
-            replace=self.kwargs["s3_overwrite"],
+            bucket_name="test",
+            replace=True,
         )
         context["task_instance"].xcom_pull.assert_called_once_with(
             task_ids=xcom_kwargs["google_api_endpoint_params_via_xcom_task_ids"],
             key=xcom_kwargs["google_api_endpoint_params_via_xcom"],
         )
-        context["task_instance"].xcom_push.assert_not_called()
-        mock_sys_getsizeof.assert_called_once_with(mock_google_api_hook_query.return_value)
+        context["task_instance"].xcom_push.assert_called_once_with(
+            key=xcom_kwargs["google_api_response_via_xcom"],
+            value={
+                "s3_uri": "s3://test/google_api_to_s3_test.csv",
+                "size": len(_to_json(response)),
+                "sha256": hashlib.sha256(_to_json(response)).hexdigest(),
+            },
+        )
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.GoogleDiscoveryApiHook.query")
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.S3Hook.load_bytes")
+    def test_execute_with_xcom_pointer_only(self, mock_s3_hook_load_bytes, mock_google_api_hook_query):
+        context = {"task_instance": Mock()}
+        mock_google_api_hook_query.return_value = GOOGLE_API_RESPONSE
+
+        GoogleApiToS3Operator(
+            **{
+                **self.kwargs,
+                "google_api_response_via_xcom": "response",
+                "xcom_pointer_only": True,
+                "s3_compression": "gzip",
+            }
+        ).execute(context)
+
+        mock_s3_hook_load_bytes.assert_called_once_with(
+            ANY, key="google_api_to_s3_test.csv.gz", bucket_name="test", replace=True
+        )
+        uploaded = mock_s3_hook_load_bytes.call_args.args[0]
+        context["task_instance"].xcom_push.assert_called_once_with(
+            key="response",
+            value={
+                "s3_uri": "s3://test/google_api_to_s3_test.csv.gz",
+                "size": len(uploaded),
+                "sha256": hashlib.sha256(uploaded).hexdigest(),
+            },
+        )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps(use_orjson):
+    data = {"reports": [{"name": "Zürich", "values": [1, 2.5, None, True]}]}
+    if use_orjson:
+        pytest.importorskip("orjson")
+        assert _json_dumps(data) == _to_json(data)
+    else:
+        with patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.orjson", None):
+            assert _json_dumps(data) == _to_json(data)
+
+
+class TestS3StreamingUpload:
+    @pytest.fixture
+    def s3_hook(self):
+        s3_hook = Mock()
+        s3_hook.extra_args = {"ServerSideEncryption": "AES256"}
+        s3_conn = s3_hook.get_conn.return_value
+        s3_conn.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+        s3_conn.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"}
+        return s3_hook
+
+    def test_single_part(self, s3_hook):
+        upload = _S3StreamingUpload(s3_hook=s3_hook, bucket_name="bucket", key="key", part_size=16)
+        upload.write(b"foo")
+        upload.write(b"bar")
+        upload.complete()
+
+        s3_hook.load_bytes.assert_called_once_with(b"foobar", key="key", bucket_name="bucket", replace=True)
+        s3_hook.get_conn.return_value.create_multipart_upload.assert_not_called()
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.get_hook_lineage_collector")
+    def test_multipart(self, mock_get_hook_lineage_collector, s3_hook):
+        s3_conn = s3_hook.get_conn.return_value
+        upload = _S3StreamingUpload(
+            s3_hook=s3_hook, bucket_name="bucket", key="key", part_size=4, max_concurrency=2
+        )
+        for chunk in (b"012", b"345", b"6789", b"ab"):
+            upload.write(chunk)
+        upload.complete()
+
+        s3_hook.load_bytes.assert_not_called()
+        s3_conn.create_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="key", ServerSideEncryption="AES256"
+        )
+        # Parts are uploaded in parallel, so the order of calls is not guaranteed.
+        assert sorted(s3_conn.upload_part.call_args_list, key=lambda c: c.kwargs["PartNumber"]) == [
+            call(Bucket="bucket", Key="key", PartNumber=1, UploadId="upload-id", Body=b"0123"),
+            call(Bucket="bucket", Key="key", PartNumber=2, UploadId="upload-id", Body=b"4567"),
+            call(Bucket="bucket", Key="key", PartNumber=3, UploadId="upload-id", Body=b"89ab"),
+        ]
+        s3_conn.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="key",
+            UploadId="upload-id",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "etag-1", "PartNumber": 1},
+                    {"ETag": "etag-2", "PartNumber": 2},
+                    {"ETag": "etag-3", "PartNumber": 3},
+                ]
+            },
+        )
+        mock_get_hook_lineage_collector.return_value.add_output_asset.assert_called_once_with(
+            context=s3_hook, scheme="s3", asset_kwargs={"bucket": "bucket", "key": "key"}
+        )
+
+    @patch("airflow.providers.amazon.aws.transfers.google_api_to_s3.get_hook_lineage_collector")
+    def test_multipart_large_write(self, mock_get_hook_lineage_collector, s3_hook):
+        s3_conn = s3_hook.get_conn.return_value
+        upload = _S3StreamingUpload(s3_hook=s3_hook, bucket_name="bucket", key="key", part_size=4)
+        upload.write(b"0123456789")
+        upload.complete()
+
+        # Data larger than a part is split, instead of being uploaded as a single part.
+        assert sorted(
+            (c.kwargs["PartNumber"], c.kwargs["Body"]) for c in s3_conn.upload_part.call_args_list
+        ) == [(1, b"0123"), (2, b"4567"), (3, b"89")]
+        s3_conn.complete_multipart_upload.assert_called_once()
+
+    def test_multipart_failed_part(self, s3_hook):
+        s3_conn = s3_hook.get_conn.return_value
+        s3_conn.upload_part.side_effect = RuntimeError("AccessDenied")
+        upload = _S3StreamingUpload(
+            s3_hook=s3_hook, bucket_name="bucket", key="key", part_size=4, max_concurrency=1
+        )
+        upload.write(b"0123")
+
+        # The failed part stops the following writes, instead of being raised only on completion.
+        with pytest.raises(RuntimeError, match="AccessDenied"):
+            upload.write(b"4567")
+        s3_conn.upload_part.assert_called_once()
+        upload.abort()
+        s3_conn.abort_multipart_upload.assert_called_once()
+        s3_conn.complete_multipart_upload.assert_not_called()
+
+    def test_abort(self, s3_hook):
+        s3_conn = s3_hook.get_conn.return_value
+        upload = _S3StreamingUpload(s3_hook=s3_hook, bucket_name="bucket", key="key", part_size=4)
+        upload.write(b"0123456789")
+        upload.abort()
+
+        s3_conn.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="key", UploadId="upload-id"
+        )
+        s3_conn.complete_multipart_upload.assert_not_called()
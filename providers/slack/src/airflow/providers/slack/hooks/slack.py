@@ -44,7 +44,8 @@ class FileUploadTypeDef(TypedDict):
     Represents the structure of the file upload data.
 
     :ivar file: Optional. Path to file which need to be sent.
-    :ivar content: Optional. File contents. If omitting this parameter, you must provide a file.
+    :ivar content: Optional. File contents, either text or binary data.
+        If omitting this parameter, you must provide a file.
     :ivar filename: Optional. Displayed filename.
     :ivar title: Optional. The title of the uploaded file.
     :ivar alt_txt: Optional. Description of image for screen-reader.
@@ -52,7 +53,7 @@ class FileUploadTypeDef(TypedDict):
     """
 
     file: NotRequired[str | None]
-    content: NotRequired[str | None]
+    content: NotRequired[str | bytes | None]
     filename: NotRequired[str | None]
     title: NotRequired[str | None]
     alt_txt: NotRequired[str | None]
@@ -232,7 +233,7 @@ class SlackHook(BaseHook):
         *,
         channels: str | Sequence[str] | None = None,
         file: str | Path | None = None,
-        content: str | None = None,
+        content: str | bytes | None = None,
         filename: str | None = None,
         initial_comment: str | None = None,
         title: str | None = None,
@@ -245,7 +246,8 @@ class SlackHook(BaseHook):
             If omitting this parameter, then file will send to workspace.
             File would be uploaded for each channel individually.
         :param file: Path to file which need to be sent.
-        :param content: File contents. If omitting this parameter, you must provide a file.
+        :param content: File contents, either text or binary data.
+            If omitting this parameter, you must provide a file.
         :param filename: Displayed filename.
         :param initial_comment: The message text introducing the file in specified ``channels``.
         :param title: Title of the file.
@@ -260,7 +262,27 @@ class SlackHook(BaseHook):
             file_uploads = {"content": content, "filename": filename}
 
         file_uploads.update({"title": title, "snippet_type": snippet_type})
+        return self.send_files_v1_to_v2(
+            channels=channels, file_uploads=file_uploads, initial_comment=initial_comment
+        )
 
+    def send_files_v1_to_v2(
+        self,
+        *,
+        channels: str | Sequence[str] | None = None,
+        file_uploads: FileUploadTypeDef | list[FileUploadTypeDef],
+        initial_comment: str | None = None,
+    ) -> list[SlackResponse]:
+        """
+        Send one or multiple files in a single message to each of the channels.
+
+        :param channels: Comma-separated list of channel names or IDs where the files will be shared.
+            If omitting this parameter, then files will send to workspace.
+            Files would be uploaded for each channel individually.
+        :param file_uploads: The file or list of the files specification to upload,
+            the same as for ``send_file_v2``.
+        :param initial_comment: The message text introducing the files in specified ``channels``.
+        """
         if channels:
             if isinstance(channels, str):
                 channels = channels.split(",")
@@ -33,7 +33,7 @@ class BaseSqlToSlackOperator(BaseOperator):
     """
     Operator implements base sql methods for SQL to Slack Transfer operators.
 
-    :param sql: The SQL query to be executed
+    :param sql: The SQL query or the list of the SQL queries to be executed
     :param sql_conn_id: reference to a specific DB-API Connection.
     :param sql_hook_params: Extra config params to be passed to the underlying hook.
         Should match the desired hook constructor params.
@@ -47,7 +47,7 @@ class BaseSqlToSlackOperator(BaseOperator):
     def __init__(
         self,
         *,
-        sql: str,
+        sql: str | list[str],
         sql_conn_id: str,
         sql_hook_params: dict | None = None,
         parameters: list | tuple | Mapping[str, Any] | None = None,
@@ -73,9 +73,13 @@ class BaseSqlToSlackOperator(BaseOperator):
             raise AirflowException("This hook is not supported. The hook class must have get_df method.")
         return hook
 
-    def _get_query_results(self) -> pd.DataFrame:
-        sql_hook = self._get_hook()
+    def _get_query_results(self, sql: str | None = None, sql_hook: DbApiHook | None = None) -> pd.DataFrame:
+        if sql is None:
+            if TYPE_CHECKING:
+                assert isinstance(self.sql, str)
+            sql = self.sql
+        sql_hook = sql_hook or self._get_hook()
 
-        self.log.info("Running SQL query: %s", self.sql)
-        df = sql_hook.get_df(self.sql, parameters=self.parameters)
+        self.log.info("Running SQL query: %s", sql)
+        df = sql_hook.get_df(sql, parameters=self.parameters)
         return df
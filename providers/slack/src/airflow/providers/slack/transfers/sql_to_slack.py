@@ -16,13 +16,18 @@
 # under the License.
 from __future__ import annotations
 
+import csv
+import os
 import warnings
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from functools import cached_property
-from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, Any, Literal
+from io import BytesIO, TextIOWrapper
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal
 
 from airflow.exceptions import AirflowException, AirflowProviderDeprecationWarning, AirflowSkipException
+from airflow.providers.common.sql.hooks.sql import DbApiHook
 from airflow.providers.slack.hooks.slack import SlackHook
 from airflow.providers.slack.transfers.base_sql_to_slack import BaseSqlToSlackOperator
 from airflow.providers.slack.utils import parse_filename
@@ -35,7 +40,204 @@ if TYPE_CHECKING:
         from airflow.utils.context import Context
 
 
-class SqlToSlackApiFileOperator(BaseSqlToSlackOperator):
+# Compression which pandas infers from the file extension.
+PANDAS_COMPRESSION_BY_EXTENSION = {
+    "gz": "gzip",
+    "bz2": "bz2",
+    "zip": "zip",
+    "xz": "xz",
+    "zst": "zstd",
+    "tar": "tar",
+}
+
+
+def _builds_df_from_cursor(sql_hook: DbApiHook) -> bool:
+    """Whether the hook builds ``pandas.DataFrame`` from the DB-API cursor, as ``DbApiHook`` does."""
+    hook_cls = sql_hook.__class__
+    return all(
+        getattr(hook_cls, name, None) is getattr(DbApiHook, name) for name in ("get_df", "_get_pandas_df")
+    )
+
+
+def _send_empty_result() -> None:
+    """Send the empty file as is."""
+
+
+def _skip_empty_result() -> None:
+    raise AirflowSkipException("SQL output df is empty. Skipping.")
+
+
+def _fail_empty_result() -> None:
+    raise ValueError("SQL output df must be non-empty. Failing.")
+
+
+# Handlers of the empty SQL output, by ``action_on_empty_df`` value.
+_EMPTY_ACTIONS: dict[str, Callable[[], None]] = {
+    "send": _send_empty_result,
+    "skip": _skip_empty_result,
+    "error": _fail_empty_result,
+}
+
+
+class _BaseSqlToSlackApiFileOperator(BaseSqlToSlackOperator):
+    """
+    Implements writing SQL query results into files for the SQL to Slack API transfer operators.
+
+    :param sql: The SQL query or the list of the SQL queries to be executed
+    :param sql_conn_id: reference to a specific DB-API Connection.
+    :param sql_hook_params: Extra config params to be passed to the underlying hook.
+        Should match the desired hook constructor params.
+    :param parameters: The parameters to pass to the SQL query.
+    :param slack_conn_id: :ref:`Slack API Connection <howto/connection:slack>`.
+    :param slack_channels: Comma-separated list of channel names or IDs where the files will be shared.
+         If omitting this parameter, then files will send to workspace.
+    :param slack_initial_comment: The message text introducing the files in specified ``slack_channels``.
+    :param slack_base_url: A string representing the Slack API base URL. Optional
+    :param df_kwargs: Keyword arguments forwarded to ``pandas.DataFrame.to_{format}()`` method.
+    :param action_on_empty_df: Specifying how to handle an empty sql output df.
+    """
+
+    SUPPORTED_FILE_FORMATS: Sequence[str] = ("csv", "json", "html")
+    # Number of rows fetched from the cursor at once, when query results are written directly to the file.
+    CURSOR_FETCH_SIZE: int = 10_000
+
+    def __init__(
+        self,
+        *,
+        sql: str | list[str],
+        sql_conn_id: str,
+        sql_hook_params: dict | None = None,
+        parameters: list | tuple | Mapping[str, Any] | None = None,
+        slack_conn_id: str = SlackHook.default_conn_name,
+        slack_channels: str | Sequence[str] | None = None,
+        slack_initial_comment: str | None = None,
+        slack_base_url: str | None = None,
+        df_kwargs: dict | None = None,
+        action_on_empty_df: Literal["send", "skip", "error"] = "send",
+        **kwargs,
+    ):
+        super().__init__(
+            sql=sql, sql_conn_id=sql_conn_id, sql_hook_params=sql_hook_params, parameters=parameters, **kwargs
+        )
+        self.slack_conn_id = slack_conn_id
+        self.slack_channels = slack_channels
+        self.slack_initial_comment = slack_initial_comment
+        self.slack_base_url = slack_base_url
+        self.df_kwargs = df_kwargs or {}
+        try:
+            self._empty_result_handler = _EMPTY_ACTIONS[action_on_empty_df]
+        except KeyError:
+            raise ValueError(f"Invalid `action_on_empty_df` value {action_on_empty_df!r}") from None
+        self.action_on_empty_df = action_on_empty_df
+
+    @cached_property
+    def slack_hook(self):
+        """Slack API Hook."""
+        return SlackHook(
+            slack_conn_id=self.slack_conn_id,
+            base_url=self.slack_base_url,
+            timeout=self.slack_timeout,
+            proxy=self.slack_proxy,
+            retry_handlers=self.slack_retry_handlers,
+        )
+
+    def _get_file_content(
+        self,
+        *,
+        sql: str,
+        filename: str,
+        output_file_format: str,
+        compression: str | None,
+    ) -> bytes:
+        """Run the SQL query and return its results written in the output file format (upper case)."""
+        buffer = BytesIO()
+        sql_hook = None
+        stream_rows = output_file_format == "CSV" and not compression and not self.df_kwargs
+        if stream_rows:
+            # Nothing pandas specific is requested, so rows could be written without DataFrame,
+            # unless the hook reads query results on its own way, e.g. ExasolHook has no DB-API cursor.
+            sql_hook = self._get_hook()
+            stream_rows = _builds_df_from_cursor(sql_hook)
+        if stream_rows:
+            if not self._stream_query_to_file(buffer, sql=sql, sql_hook=sql_hook):
+                self._empty_result_handler()
+        else:
+            df_result = self._get_query_results(sql=sql, sql_hook=sql_hook)
+            if df_result.empty:
+                self._empty_result_handler()
+            df_writer = {
+                "CSV": df_result.to_csv,
+                "JSON": df_result.to_json,
+                "HTML": df_result.to_html,
+            }.get(output_file_format)
+            if df_writer is None:
+                # Not expected that this error happen. This only possible
+                # if SUPPORTED_FILE_FORMATS extended and no actual implementation for specific format.
+                raise AirflowException(f"Unexpected output file format: {output_file_format}")
+
+            df_kwargs = {**self._default_kwargs_for(output_file_format), **self.df_kwargs}
+            if output_file_format == "HTML":
+                # pandas can't write HTML into binary buffer, and doesn't compress HTML output.
+                text_buffer = TextIOWrapper(buffer, encoding="utf-8")
+                df_writer(text_buffer, **df_kwargs)
+                text_buffer.detach()
+            else:
+                df_writer(buffer, **{**self._compression_kwargs(compression, filename), **df_kwargs})
+        return buffer.getvalue()
+
+    def _default_kwargs_for(self, output_file_format: str) -> dict[str, Any]:
+        """Default keyword arguments for ``pandas.DataFrame.to_{format}()``, overridden by ``df_kwargs``."""
+        if output_file_format == "JSON":
+            if "orient" in self.df_kwargs:
+                # Keep the output requested by the user, e.g. JSON array for ``orient="records"``.
+                return {}
+            return {"orient": "records", "lines": True}
+        return {"index": False}
+
+    def _compression_kwargs(self, compression: str | None, filename: str) -> dict[str, Any]:
+        """Compression arguments for pandas, the same as pandas infers from the file extension."""
+        method = PANDAS_COMPRESSION_BY_EXTENSION.get(compression) if compression else None
+        if method is None:
+            return {}
+        if method == "zip":
+            # Name the file in the archive after the filename without the ``.zip`` extension.
+            return {"compression": {"method": method, "archive_name": filename.rsplit(".", 1)[0]}}
+        return {"compression": method}
+
+    def _stream_query_to_file(self, fp: BinaryIO, sql: str, sql_hook: DbApiHook | None = None) -> int:
+        """
+        Write the query results directly from the DB-API cursor into the CSV file object.
+
+        The output is the same as ``pandas.DataFrame.to_csv(index=False)`` produces, but rows are fetched
+        in batches of ``CURSOR_FETCH_SIZE`` instead of building the whole ``pandas.DataFrame`` in memory.
+
+        :param fp: The binary file object to write UTF-8 encoded CSV into.
+        :param sql: The SQL query to be executed.
+        :param sql_hook: The DB-API hook to run the query, created from ``sql_conn_id`` if not set.
+        :return: Number of the written rows.
+        """
+        sql_hook = sql_hook or self._get_hook()
+
+        self.log.info("Running SQL query: %s", sql)
+        row_count = 0
+        with closing(sql_hook.get_conn()) as conn, closing(conn.cursor()) as cursor:
+            if self.parameters:
+                cursor.execute(sql, self.parameters)
+            else:
+                cursor.execute(sql)
+
+            text_fp = TextIOWrapper(fp, encoding="utf-8", newline="")
+            writer = csv.writer(text_fp, lineterminator=os.linesep)
+            writer.writerow([column[0] for column in cursor.description or ()])
+            while rows := cursor.fetchmany(self.CURSOR_FETCH_SIZE):
+                writer.writerows(rows)
+                row_count += len(rows)
+            # Flush the written data and keep the underlying file object open.
+            text_fp.detach()
+        return row_count
+
+
+class SqlToSlackApiFileOperator(_BaseSqlToSlackApiFileOperator):
     """
     Executes an SQL statement in a given SQL connection and sends the results to Slack API as file.
 
@@ -60,24 +262,40 @@ class SqlToSlackApiFileOperator(BaseSqlToSlackOperator):
     :param slack_base_url: A string representing the Slack API base URL. Optional
     :param slack_method_version: The version of the Slack SDK Client method to be used, either "v1" or "v2".
     :param df_kwargs: Keyword arguments forwarded to ``pandas.DataFrame.to_{format}()`` method.
+        By default, the index is not written into CSV and HTML files, and JSON files are written
+        as newline-delimited records (``orient="records", lines=True``) unless ``orient`` is set,
+        these defaults could be overridden by ``df_kwargs``.
+        If not set, uncompressed CSV files are written directly from the DB-API cursor,
+        without loading the whole result into ``pandas.DataFrame``, unless the SQL hook
+        overrides how ``get_df`` reads the query results.
     :param action_on_empty_df: Specifying how to handle an empty sql output df. Possible values:
 
         - ``send``: (default) send the slack with an empty file.
         - ``skip``: skip sending the slack message. Task state set to "skipped".
         - ``error``: raise an error to fail the task. Task state set to "failed".
+
+    :param empty_check_sql: Optional SQL query which is executed before ``sql`` to find out
+        whether the result is empty, e.g. ``SELECT COUNT(*) ...`` or ``SELECT 1 ... LIMIT 1``.
+        The result is considered empty if the query returns no rows, or the first column of the first row
+        is ``0`` or ``NULL``. In that case ``action_on_empty_df`` is applied without running ``sql``.
+        Used only if ``action_on_empty_df`` is ``skip`` or ``error``.
+        The query is executed with the same ``parameters`` as ``sql``, so it should use the same
+        placeholders, since some drivers (e.g. psycopg2) fail on parameters not used in the query.
+
+        .. note:: This adds a round trip to the database if the result is not empty,
+            so it is useful only if ``sql`` is expensive and often returns nothing.
     """
 
     template_fields: Sequence[str] = (
         "sql",
+        "empty_check_sql",
         "slack_channels",
         "slack_filename",
         "slack_initial_comment",
         "slack_title",
     )
     template_ext: Sequence[str] = (".sql", ".jinja", ".j2")
-    template_fields_renderers = {"sql": "sql", "slack_message": "jinja"}
-
-    SUPPORTED_FILE_FORMATS: Sequence[str] = ("csv", "json", "html")
+    template_fields_renderers = {"sql": "sql", "empty_check_sql": "sql", "slack_message": "jinja"}
 
     def __init__(
         self,
@@ -95,22 +313,26 @@ class SqlToSlackApiFileOperator(BaseSqlToSlackOperator):
         slack_method_version: Literal["v1", "v2"] | None = None,
         df_kwargs: dict | None = None,
         action_on_empty_df: Literal["send", "skip", "error"] = "send",
+        empty_check_sql: str | None = None,
         **kwargs,
     ):
         super().__init__(
-            sql=sql, sql_conn_id=sql_conn_id, sql_hook_params=sql_hook_params, parameters=parameters, **kwargs
+            sql=sql,
+            sql_conn_id=sql_conn_id,
+            sql_hook_params=sql_hook_params,
+            parameters=parameters,
+            slack_conn_id=slack_conn_id,
+            slack_channels=slack_channels,
+            slack_initial_comment=slack_initial_comment,
+            slack_base_url=slack_base_url,
+            df_kwargs=df_kwargs,
+            action_on_empty_df=action_on_empty_df,
+            **kwargs,
         )
-        self.slack_conn_id = slack_conn_id
         self.slack_filename = slack_filename
-        self.slack_channels = slack_channels
-        self.slack_initial_comment = slack_initial_comment
         self.slack_title = slack_title
-        self.slack_base_url = slack_base_url
         self.slack_method_version = slack_method_version
-        self.df_kwargs = df_kwargs or {}
-        if not action_on_empty_df or action_on_empty_df not in ("send", "skip", "error"):
-            raise ValueError(f"Invalid `action_on_empty_df` value {action_on_empty_df!r}")
-        self.action_on_empty_df = action_on_empty_df
+        self.empty_check_sql = empty_check_sql
 
         if self.slack_method_version:
             warnings.warn(
@@ -120,54 +342,145 @@ class SqlToSlackApiFileOperator(BaseSqlToSlackOperator):
             )
 
     @cached_property
-    def slack_hook(self):
-        """Slack API Hook."""
-        return SlackHook(
-            slack_conn_id=self.slack_conn_id,
-            base_url=self.slack_base_url,
-            timeout=self.slack_timeout,
-            proxy=self.slack_proxy,
-            retry_handlers=self.slack_retry_handlers,
+    def _parsed_filename(self) -> tuple[str, str | None]:
+        """
+        Output file format in upper case and compression, parsed from the rendered ``slack_filename``.
+
+        Should be accessed only after the template fields are rendered.
+        """
+        output_file_format, compression = parse_filename(
+            filename=self.slack_filename,
+            supported_file_formats=self.SUPPORTED_FILE_FORMATS,
         )
+        return output_file_format.upper(), compression
 
     def execute(self, context: Context) -> None:
-        # Parse file format from filename
-        output_file_format, _ = parse_filename(
+        output_file_format, compression = self._parsed_filename
+        if self.empty_check_sql and self.action_on_empty_df != "send" and self._check_result_is_empty():
+            self._empty_result_handler()
+
+        if TYPE_CHECKING:
+            assert isinstance(self.sql, str)
+        content = self._get_file_content(
+            sql=self.sql,
             filename=self.slack_filename,
-            supported_file_formats=self.SUPPORTED_FILE_FORMATS,
+            output_file_format=output_file_format,
+            compression=compression,
+        )
+        self.slack_hook.send_file_v1_to_v2(
+            channels=self.slack_channels,
+            content=content,
+            filename=self.slack_filename,
+            initial_comment=self.slack_initial_comment,
+            title=self.slack_title,
         )
 
-        with NamedTemporaryFile(mode="w+", suffix=f"_{self.slack_filename}") as fp:
-            # tempfile.NamedTemporaryFile used only for create and remove temporary file,
-            # pandas will open file in correct mode itself depend on file type.
-            # So we close file descriptor here for avoid incidentally write anything.
-            fp.close()
+    def _check_result_is_empty(self) -> bool:
+        sql_hook = self._get_hook()
 
-            output_file_name = fp.name
-            output_file_format = output_file_format.upper()
-            df_result = self._get_query_results()
-            if df_result.empty:
-                if self.action_on_empty_df == "skip":
-                    raise AirflowSkipException("SQL output df is empty. Skipping.")
-                if self.action_on_empty_df == "error":
-                    raise ValueError("SQL output df must be non-empty. Failing.")
-                if self.action_on_empty_df != "send":
-                    raise ValueError(f"Invalid `action_on_empty_df` value {self.action_on_empty_df!r}")
-            if output_file_format == "CSV":
-                df_result.to_csv(output_file_name, **self.df_kwargs)
-            elif output_file_format == "JSON":
-                df_result.to_json(output_file_name, **self.df_kwargs)
-            elif output_file_format == "HTML":
-                df_result.to_html(output_file_name, **self.df_kwargs)
-            else:
-                # Not expected that this error happen. This only possible
-                # if SUPPORTED_FILE_FORMATS extended and no actual implementation for specific format.
-                raise AirflowException(f"Unexpected output file format: {output_file_format}")
+        self.log.info("Running SQL query to check that result is not empty: %s", self.empty_check_sql)
+        first_row = sql_hook.get_first(self.empty_check_sql, parameters=self.parameters)
+        return not first_row or first_row[0] is None or first_row[0] == 0
+
+
+class SqlToSlackApiFilesBatchOperator(_BaseSqlToSlackApiFileOperator):
+    """
+    Executes several SQL statements in a given SQL connection and sends the results to Slack API as files.
+
+    The SQL statements are executed concurrently, and all files are shared in a single message
+    per channel, instead of running one ``SqlToSlackApiFileOperator`` task for each of them.
+
+    :param queries: Sequence of ``(sql, slack_filename)`` pairs, each SQL query results are sent as file
+        with the paired filename. The filename should contain supported extension, the same as
+        ``slack_filename`` of ``SqlToSlackApiFileOperator``.
+    :param sql_conn_id: reference to a specific DB-API Connection.
+    :param slack_conn_id: :ref:`Slack API Connection <howto/connection:slack>`.
+    :param sql_hook_params: Extra config params to be passed to the underlying hook.
+        Should match the desired hook constructor params.
+    :param parameters: The parameters to pass to each of the SQL queries.
+    :param slack_channels: Comma-separated list of channel names or IDs where the files will be shared.
+         If omitting this parameter, then files will send to workspace.
+    :param slack_initial_comment: The message text introducing the files in specified ``slack_channels``.
+    :param slack_base_url: A string representing the Slack API base URL. Optional
+    :param df_kwargs: Keyword arguments forwarded to ``pandas.DataFrame.to_{format}()`` method,
+        the same for each file, see ``SqlToSlackApiFileOperator``.
+    :param action_on_empty_df: Specifying how to handle an empty sql output df, applied if any of
+        the SQL queries returns an empty result, see ``SqlToSlackApiFileOperator``.
+    :param max_concurrent_queries: Maximum number of SQL queries executed at the same time.
+    """
+
+    template_fields: Sequence[str] = ("sql", "slack_filenames", "slack_channels", "slack_initial_comment")
+    template_ext: Sequence[str] = (".sql", ".jinja", ".j2")
+    template_fields_renderers = {"sql": "sql", "slack_filenames": "py", "slack_initial_comment": "jinja"}
+
+    def __init__(
+        self,
+        *,
+        queries: Sequence[tuple[str, str]],
+        sql_conn_id: str,
+        sql_hook_params: dict | None = None,
+        parameters: list | tuple | Mapping[str, Any] | None = None,
+        slack_conn_id: str = SlackHook.default_conn_name,
+        slack_channels: str | Sequence[str] | None = None,
+        slack_initial_comment: str | None = None,
+        slack_base_url: str | None = None,
+        df_kwargs: dict | None = None,
+        action_on_empty_df: Literal["send", "skip", "error"] = "send",
+        max_concurrent_queries: int = 4,
+        **kwargs,
+    ):
+        if not queries:
+            raise ValueError("At least one `(sql, slack_filename)` pair must be provided in `queries`.")
+        super().__init__(
+            sql=[sql for sql, _ in queries],
+            sql_conn_id=sql_conn_id,
+            sql_hook_params=sql_hook_params,
+            parameters=parameters,
+            slack_conn_id=slack_conn_id,
+            slack_channels=slack_channels,
+            slack_initial_comment=slack_initial_comment,
+            slack_base_url=slack_base_url,
+            df_kwargs=df_kwargs,
+            action_on_empty_df=action_on_empty_df,
+            **kwargs,
+        )
+        self.slack_filenames = [filename for _, filename in queries]
+        self.max_concurrent_queries = max_concurrent_queries
 
-            self.slack_hook.send_file_v1_to_v2(
-                channels=self.slack_channels,
-                file=output_file_name,
-                filename=self.slack_filename,
-                initial_comment=self.slack_initial_comment,
-                title=self.slack_title,
+    def execute(self, context: Context) -> None:
+        # Parse file formats first, so unsupported filename fails the task before running any query.
+        file_formats = []
+        for filename in self.slack_filenames:
+            output_file_format, compression = parse_filename(
+                filename=filename, supported_file_formats=self.SUPPORTED_FILE_FORMATS
             )
+            file_formats.append((output_file_format.upper(), compression))
+        max_workers = max(1, min(self.max_concurrent_queries, len(self.sql)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._get_file_content,
+                    sql=sql,
+                    filename=filename,
+                    output_file_format=output_file_format,
+                    compression=compression,
+                )
+                for sql, filename, (output_file_format, compression) in zip(
+                    self.sql, self.slack_filenames, file_formats
+                )
+            ]
+            try:
+                contents = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        self.slack_hook.send_files_v1_to_v2(
+            channels=self.slack_channels,
+            file_uploads=[
+                {"content": content, "filename": filename}
+                for filename, content in zip(self.slack_filenames, contents)
+            ],
+            initial_comment=self.slack_initial_comment,
+        )
@@ -539,3 +539,28 @@ class TestSlackHook:
         with mock.patch.object(SlackHook, "send_file_v2") as mocked_send_file_v2:
             hook.send_file_v1_to_v2(channels=channels, content="Fake")
             assert mocked_send_file_v2.call_count == expected_calls
+
+    @pytest.mark.parametrize(
+        "channels, expected_channel_ids",
+        [
+            pytest.param(None, [None], id="no-channel"),
+            pytest.param("#random", ["#random"], id="single-channel"),
+            pytest.param("#foo, #bar", ["#foo", "#bar"], id="comma-separated-string"),
+            pytest.param(["#random", "#development"], ["#random", "#development"], id="list"),
+        ],
+    )
+    def test_send_files_v1_to_v2(self, channels, expected_channel_ids):
+        hook = SlackHook(slack_conn_id=SLACK_API_DEFAULT_CONN_ID)
+        file_uploads = [
+            {"content": '{"foo": "bar"}', "filename": "foo.json"},
+            {"content": "spam,egg", "filename": "bar.csv"},
+        ]
+        with mock.patch.object(SlackHook, "send_file_v2") as mocked_send_file_v2:
+            responses = hook.send_files_v1_to_v2(
+                channels=channels, file_uploads=file_uploads, initial_comment="test comment"
+            )
+            assert mocked_send_file_v2.call_args_list == [
+                mock.call(channel_id=channel_id, file_uploads=file_uploads, initial_comment="test comment")
+                for channel_id in expected_channel_ids
+            ]
+            assert responses == [mocked_send_file_v2.return_value] * len(expected_channel_ids)
@@ -16,12 +16,20 @@
 # under the License.
 from __future__ import annotations
 
+import gzip
+from io import BytesIO
 from unittest import mock
 
+import pandas as pd
 import pytest
 
-from airflow.exceptions import AirflowSkipException
-from airflow.providers.slack.transfers.sql_to_slack import SqlToSlackApiFileOperator
+from airflow.exceptions import AirflowException, AirflowSkipException
+from airflow.providers.common.sql.hooks.sql import DbApiHook
+from airflow.providers.slack.transfers.sql_to_slack import (
+    SqlToSlackApiFileOperator,
+    SqlToSlackApiFilesBatchOperator,
+)
+from airflow.providers.slack.utils import parse_filename
 
 try:
     from airflow.sdk import timezone
@@ -31,6 +39,11 @@ except ImportError:
 TEST_DAG_ID = "sql_to_slack_unit_test"
 TEST_TASK_ID = "sql_to_slack_unit_test_task"
 DEFAULT_DATE = timezone.datetime(2017, 1, 1)
+DEFAULT_DF_KWARGS = {
+    "to_csv": {"index": False},
+    "to_json": {"orient": "records", "lines": True},
+    "to_html": {"index": False},
+}
 
 
 class TestSqlToSlackApiFileOperator:
@@ -43,16 +56,27 @@ class TestSqlToSlackApiFileOperator:
             "parameters": None,
         }
 
+    @mock.patch(
+        "airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_hook",
+        return_value=mock.MagicMock(spec=DbApiHook),
+    )
+    @mock.patch(
+        "airflow.providers.slack.transfers.sql_to_slack.SqlToSlackApiFileOperator._stream_query_to_file"
+    )
     @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_query_results")
     @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
     @pytest.mark.parametrize(
-        "filename,df_method",
+        "filename,df_method,compression_kwargs",
         [
-            ("awesome.json", "to_json"),
-            ("awesome.json.zip", "to_json"),
-            ("awesome.csv", "to_csv"),
-            ("awesome.csv.xz", "to_csv"),
-            ("awesome.html", "to_html"),
+            ("awesome.json", "to_json", {}),
+            (
+                "awesome.json.zip",
+                "to_json",
+                {"compression": {"method": "zip", "archive_name": "awesome.json"}},
+            ),
+            ("awesome.csv", "to_csv", {}),
+            ("awesome.csv.xz", "to_csv", {"compression": "xz"}),
+            ("awesome.html", "to_html", {}),
         ],
     )
     @pytest.mark.parametrize("df_kwargs", [None, {}, {"foo": "bar"}])
@@ -88,8 +112,11 @@ class TestSqlToSlackApiFileOperator:
         self,
         mock_slack_hook_cls,
         mock_get_query_results,
+        mock_stream_query_to_file,
+        mock_get_hook,
         filename,
         df_method,
+        compression_kwargs,
         df_kwargs,
         channels,
         initial_comment,
@@ -125,16 +152,52 @@ class TestSqlToSlackApiFileOperator:
         mock_slack_hook_cls.assert_called_once_with(
             slack_conn_id="expected-test-slack-conn-id", **hook_extra_kwargs
         )
-        mock_get_query_results.assert_called_once_with()
-        mock_df_output_method.assert_called_once_with(mock.ANY, **(df_kwargs or {}))
+        if filename == "awesome.csv" and not df_kwargs:
+            mock_stream_query_to_file.assert_called_once_with(
+                mock.ANY, sql="SELECT 1", sql_hook=mock_get_hook.return_value
+            )
+            mock_get_query_results.assert_not_called()
+        else:
+            mock_stream_query_to_file.assert_not_called()
+            mock_get_query_results.assert_called_once_with(sql="SELECT 1", sql_hook=None)
+            mock_df_output_method.assert_called_once_with(
+                mock.ANY, **compression_kwargs, **DEFAULT_DF_KWARGS[df_method], **(df_kwargs or {})
+            )
         mock_send_file.assert_called_once_with(
             channels=channels,
             filename=filename,
             initial_comment=initial_comment,
             title=title,
-            file=mock.ANY,
+            content=mock.ANY,
         )
 
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_query_results")
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
+    @pytest.mark.parametrize(
+        "filename, df_kwargs, expected_content",
+        [
+            pytest.param("awesome.csv.gz", None, b"a,b\n1,spam\n", id="csv-gzip"),
+            pytest.param("awesome.json", None, b'{"a":1,"b":"spam"}\n', id="json-lines"),
+            pytest.param("awesome.json", {"orient": "records"}, b'[{"a":1,"b":"spam"}]', id="json-records"),
+            pytest.param("awesome.json", {"orient": "split", "index": False}, None, id="json-split"),
+        ],
+    )
+    def test_send_file_content(
+        self, mock_slack_hook_cls, mock_get_query_results, filename, df_kwargs, expected_content
+    ):
+        mock_get_query_results.return_value = pd.DataFrame({"a": [1], "b": ["spam"]})
+        op = SqlToSlackApiFileOperator(
+            task_id="test_send_file", slack_filename=filename, df_kwargs=df_kwargs, **self.default_op_kwargs
+        )
+        op.execute(mock.MagicMock())
+
+        content = mock_slack_hook_cls.return_value.send_file_v1_to_v2.call_args.kwargs["content"]
+        if filename.endswith(".gz"):
+            content = gzip.decompress(content)
+        if expected_content is None:
+            expected_content = mock_get_query_results.return_value.to_json(**df_kwargs).encode()
+        assert content == expected_content
+
     @pytest.mark.parametrize(
         "filename",
         [
@@ -151,13 +214,24 @@ class TestSqlToSlackApiFileOperator:
         with pytest.raises(ValueError):
             op.execute(mock.MagicMock())
 
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_query_results")
+    def test_not_implemented_format(self, mock_get_query_results, mock_slack_hook_cls):
+        op = SqlToSlackApiFileOperator(
+            task_id="test_send_file", slack_filename="spam.xml", **self.default_op_kwargs
+        )
+        op.SUPPORTED_FILE_FORMATS = (*op.SUPPORTED_FILE_FORMATS, "xml")
+        with pytest.raises(AirflowException, match="Unexpected output file format: XML"):
+            op.execute(mock.MagicMock())
+        mock_slack_hook_cls.assert_not_called()
+
     @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
     @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_query_results")
     def test_null_output_sending_empty_file_by_default(self, mock_get_query_results, mock_slack_hook_cls):
         op_kwargs = {
             **self.default_op_kwargs,
             "slack_conn_id": "expected-test-slack-conn-id",
-            "slack_filename": "test_filename.csv",
+            "slack_filename": "test_filename.json",
             "slack_channels": ["#random"],
             "slack_initial_comment": "test_comment",
             "slack_title": "test_title",
@@ -178,7 +252,7 @@ class TestSqlToSlackApiFileOperator:
         op_kwargs = {
             **self.default_op_kwargs,
             "slack_conn_id": "expected-test-slack-conn-id",
-            "slack_filename": "test_filename.csv",
+            "slack_filename": "test_filename.json",
             "slack_channels": ["#random"],
             "slack_initial_comment": "test_comment",
             "slack_title": "test_title",
@@ -201,7 +275,7 @@ class TestSqlToSlackApiFileOperator:
         op_kwargs = {
             **self.default_op_kwargs,
             "slack_conn_id": "expected-test-slack-conn-id",
-            "slack_filename": "test_filename.csv",
+            "slack_filename": "test_filename.json",
             "slack_channels": ["#random"],
             "slack_initial_comment": "test_comment",
             "slack_title": "test_title",
@@ -217,3 +291,300 @@ class TestSqlToSlackApiFileOperator:
         with pytest.raises(ValueError, match=r"output df must be non-empty\. Failing"):
             op.execute(mock.MagicMock())
         mock_slack_hook_cls.assert_not_called()
+
+    @pytest.mark.parametrize("action_on_empty_df", [None, "", "ignore", "SKIP"])
+    def test_invalid_action_on_empty_df(self, action_on_empty_df):
+        with pytest.raises(ValueError, match="Invalid `action_on_empty_df` value"):
+            SqlToSlackApiFileOperator(
+                task_id="test_send_file",
+                slack_filename="test_filename.csv",
+                action_on_empty_df=action_on_empty_df,
+                **self.default_op_kwargs,
+            )
+
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
+    @mock.patch(
+        "airflow.providers.slack.transfers.sql_to_slack.SqlToSlackApiFileOperator._stream_query_to_file",
+        return_value=0,
+    )
+    @mock.patch(
+        "airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_hook",
+        return_value=mock.MagicMock(spec=DbApiHook),
+    )
+    @pytest.mark.parametrize(
+        "action_on_empty_df, expected_exception",
+        [
+            pytest.param("send", None, id="send"),
+            pytest.param("skip", AirflowSkipException, id="skip"),
+            pytest.param("error", ValueError, id="error"),
+        ],
+    )
+    def test_null_output_streamed_to_csv(
+        self,
+        mock_get_hook,
+        mock_stream_query_to_file,
+        mock_slack_hook_cls,
+        action_on_empty_df,
+        expected_exception,
+    ):
+        op = SqlToSlackApiFileOperator(
+            task_id="test_send_file",
+            slack_filename="test_filename.csv",
+            action_on_empty_df=action_on_empty_df,
+            **self.default_op_kwargs,
+        )
+        if expected_exception:
+            with pytest.raises(expected_exception):
+                op.execute(mock.MagicMock())
+            mock_slack_hook_cls.assert_not_called()
+        else:
+            op.execute(mock.MagicMock())
+            mock_slack_hook_cls.return_value.send_file_v1_to_v2.assert_called_once()
+        mock_stream_query_to_file.assert_called_once_with(
+            mock.ANY, sql="SELECT 1", sql_hook=mock_get_hook.return_value
+        )
+
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
+    @mock.patch(
+        "airflow.providers.slack.transfers.sql_to_slack.SqlToSlackApiFileOperator._stream_query_to_file"
+    )
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_hook")
+    def test_csv_from_hook_with_own_get_df(
+        self, mock_get_hook, mock_stream_query_to_file, mock_slack_hook_cls
+    ):
+        class PandasExportHook(DbApiHook):
+            # Same as ExasolHook, which reads DataFrame without DB-API cursor.
+            def get_df(self, sql, parameters=None, **kwargs):
+                return self.get_conn().export_to_pandas(sql)
+
+        mock_get_hook.return_value = mock.MagicMock(spec=PandasExportHook)
+        mock_get_hook.return_value.get_df.return_value = pd.DataFrame({"a": [1], "b": ["spam"]})
+        op = SqlToSlackApiFileOperator(
+            task_id="test_send_file", slack_filename="test_filename.csv", **self.default_op_kwargs
+        )
+
+        op.execute(mock.MagicMock())
+        mock_stream_query_to_file.assert_not_called()
+        mock_get_hook.return_value.get_conn.assert_not_called()
+        mock_get_hook.return_value.get_df.assert_called_once_with("SELECT 1", parameters=None)
+        mock_slack_hook_cls.return_value.send_file_v1_to_v2.assert_called_once_with(
+            channels=None,
+            content=b"a,b\n1,spam\n",
+            filename="test_filename.csv",
+            initial_comment=None,
+            title=None,
+        )
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            pytest.param("test_filename.csv", ("CSV", None), id="csv"),
+            pytest.param("test_filename.json.gz", ("JSON", "gz"), id="json-gz"),
+        ],
+    )
+    def test_parsed_filename(self, filename, expected):
+        op = SqlToSlackApiFileOperator(
+            task_id="test_send_file", slack_filename=filename, **self.default_op_kwargs
+        )
+
+        with mock.patch(
+            "airflow.providers.slack.transfers.sql_to_slack.parse_filename", wraps=parse_filename
+        ) as mock_parse_filename:
+            assert op._parsed_filename == expected
+            assert op._parsed_filename == expected
+        mock_parse_filename.assert_called_once_with(
+            filename=filename, supported_file_formats=op.SUPPORTED_FILE_FORMATS
+        )
+
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_hook")
+    @pytest.mark.parametrize("parameters", [None, {"col": "spam-egg"}])
+    def test_stream_query_to_file(self, mock_get_hook, parameters):
+        mock_cursor = mock_get_hook.return_value.get_conn.return_value.cursor.return_value
+        mock_cursor.description = [("id", None), ("name", None), ("score", None)]
+        mock_cursor.fetchmany.side_effect = [
+            [(1, "spam", 4.5), (2, "egg, bacon", None)],
+            [(3, 'say "hello"', 0.0)],
+            [],
+        ]
+        output_file = BytesIO()
+        op = SqlToSlackApiFileOperator(
+            task_id="test_send_file",
+            slack_filename="test_filename.csv",
+            **{**self.default_op_kwargs, "parameters": parameters},
+        )
+
+        assert op._stream_query_to_file(output_file, sql="SELECT 1") == 3
+        if parameters:
+            mock_cursor.execute.assert_called_once_with("SELECT 1", parameters)
+        else:
+            mock_cursor.execute.assert_called_once_with("SELECT 1")
+        mock_cursor.fetchmany.assert_called_with(op.CURSOR_FETCH_SIZE)
+        mock_cursor.close.assert_called_once_with()
+        mock_get_hook.return_value.get_conn.return_value.close.assert_called_once_with()
+        assert output_file.getvalue().decode().splitlines() == [
+            "id,name,score",
+            "1,spam,4.5",
+            '2,"egg, bacon",',
+            '3,"say ""hello""",0.0',
+        ]
+
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_query_results")
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_hook")
+    @pytest.mark.parametrize(
+        "action_on_empty_df, expected_exception",
+        [
+            pytest.param("skip", AirflowSkipException, id="skip"),
+            pytest.param("error", ValueError, id="error"),
+        ],
+    )
+    @pytest.mark.parametrize("first_row", [None, (0,), (None,)])
+    def test_empty_check_sql_empty_result(
+        self,
+        mock_get_hook,
+        mock_get_query_results,
+        mock_slack_hook_cls,
+        action_on_empty_df,
+        expected_exception,
+        first_row,
+    ):
+        mock_get_hook.return_value.get_first.return_value = first_row
+        op = SqlToSlackApiFileOperator(
+            task_id="test_send_file",
+            slack_filename="test_filename.json",
+            action_on_empty_df=action_on_empty_df,
+            empty_check_sql="SELECT COUNT(*) FROM spam",
+            **self.default_op_kwargs,
+        )
+
+        with pytest.raises(expected_exception):
+            op.execute(mock.MagicMock())
+        mock_get_hook.return_value.get_first.assert_called_once_with(
+            "SELECT COUNT(*) FROM spam", parameters=None
+        )
+        mock_get_query_results.assert_not_called()
+        mock_slack_hook_cls.assert_not_called()
+
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_query_results")
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_hook")
+    @pytest.mark.parametrize(
+        "action_on_empty_df, first_row, expected_check",
+        [
+            pytest.param("skip", (42,), True, id="skip-not-empty"),
+            pytest.param("skip", ("",), True, id="skip-empty-string"),
+            pytest.param("error", (1,), True, id="error-not-empty"),
+            pytest.param("send", (0,), False, id="send"),
+        ],
+    )
+    def test_empty_check_sql_runs_query(
+        self,
+        mock_get_hook,
+        mock_get_query_results,
+        mock_slack_hook_cls,
+        action_on_empty_df,
+        first_row,
+        expected_check,
+    ):
+        mock_get_hook.return_value.get_first.return_value = first_row
+        mock_get_query_results.return_value = pd.DataFrame({"a": [1]})
+        op = SqlToSlackApiFileOperator(
+            task_id="test_send_file",
+            slack_filename="test_filename.json",
+            action_on_empty_df=action_on_empty_df,
+            empty_check_sql="SELECT COUNT(*) FROM spam",
+            **self.default_op_kwargs,
+        )
+
+        op.execute(mock.MagicMock())
+        assert mock_get_hook.return_value.get_first.called is expected_check
+        mock_get_query_results.assert_called_once_with(sql="SELECT 1", sql_hook=None)
+        mock_slack_hook_cls.return_value.send_file_v1_to_v2.assert_called_once()
+
+
+class TestSqlToSlackApiFilesBatchOperator:
+    def setup_method(self):
+        self.default_op_kwargs = {
+            "sql_conn_id": "test-sql-conn-id",
+            "slack_conn_id": "test-slack-conn-id",
+            "slack_channels": "#random,#general",
+            "slack_initial_comment": "test_comment",
+        }
+
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_hook")
+    def test_send_files(self, mock_get_hook, mock_slack_hook_cls):
+        dfs = {
+            "SELECT a FROM spam": pd.DataFrame({"a": [1, 2]}),
+            "SELECT b FROM egg": pd.DataFrame({"b": ["bacon"]}),
+        }
+        mock_get_hook.return_value.get_df.side_effect = lambda sql, parameters: dfs[sql]
+        op = SqlToSlackApiFilesBatchOperator(
+            task_id="test_send_files",
+            queries=[("SELECT a FROM spam", "spam.json"), ("SELECT b FROM egg", "egg.csv.gz")],
+            **self.default_op_kwargs,
+        )
+
+        op.execute(mock.MagicMock())
+        # Each query gets its own hook, since DB-API hooks are not thread-safe.
+        assert mock_get_hook.call_count == 2
+        mock_slack_hook_cls.return_value.send_files_v1_to_v2.assert_called_once_with(
+            channels="#random,#general",
+            file_uploads=[
+                {"content": b'{"a":1}\n{"a":2}\n', "filename": "spam.json"},
+                {"content": mock.ANY, "filename": "egg.csv.gz"},
+            ],
+            initial_comment="test_comment",
+        )
+        file_uploads = mock_slack_hook_cls.return_value.send_files_v1_to_v2.call_args.kwargs["file_uploads"]
+        assert gzip.decompress(file_uploads[1]["content"]) == b"b\nbacon\n"
+
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_hook")
+    def test_empty_result(self, mock_get_hook, mock_slack_hook_cls):
+        mock_get_hook.return_value.get_df.return_value = pd.DataFrame()
+        op = SqlToSlackApiFilesBatchOperator(
+            task_id="test_send_files",
+            queries=[("SELECT 1", "spam.json"), ("SELECT 2", "egg.json")],
+            action_on_empty_df="skip",
+            **self.default_op_kwargs,
+        )
+
+        with pytest.raises(AirflowSkipException):
+            op.execute(mock.MagicMock())
+        mock_slack_hook_cls.assert_not_called()
+
+    def test_no_queries(self):
+        with pytest.raises(ValueError, match="At least one"):
+            SqlToSlackApiFilesBatchOperator(task_id="test_send_files", queries=[], **self.default_op_kwargs)
+
+    @pytest.mark.parametrize(
+        "unsupported_kwargs",
+        [
+            pytest.param({"slack_title": "Title"}, id="slack_title"),
+            pytest.param({"empty_check_sql": "SELECT 1"}, id="empty_check_sql"),
+            pytest.param({"sql": "SELECT 1", "slack_filename": "spam.json"}, id="single_file"),
+        ],
+    )
+    def test_unsupported_options(self, unsupported_kwargs):
+        with pytest.raises((TypeError, AirflowException), match="Invalid arguments were passed"):
+            SqlToSlackApiFilesBatchOperator(
+                task_id="test_send_files",
+                queries=[("SELECT 1", "spam.json")],
+                **unsupported_kwargs,
+                **self.default_op_kwargs,
+            )
+
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.SlackHook")
+    @mock.patch("airflow.providers.slack.transfers.sql_to_slack.BaseSqlToSlackOperator._get_hook")
+    def test_unsupported_file_format(self, mock_get_hook, mock_slack_hook_cls):
+        op = SqlToSlackApiFilesBatchOperator(
+            task_id="test_send_files",
+            queries=[("SELECT 1", "spam.json"), ("SELECT 2", "egg.xlsx")],
+            **self.default_op_kwargs,
+        )
+
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            op.execute(mock.MagicMock())
+        mock_get_hook.assert_not_called()
+        mock_slack_hook_cls.assert_not_called()